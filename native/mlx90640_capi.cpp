@@ -0,0 +1,17 @@
+// Single translation unit that builds the melexis mlx90640-library with C
+// linkage, so src/_mlx_native.py can bind its functions by name.
+//
+// The library's headers have no extern "C" and its sources are C++, so a
+// plain g++ build exports mangled names. Declaring the API inside an
+// extern "C" block first gives every later definition C linkage too.
+//
+// From a checkout of https://github.com/melexis/mlx90640-library:
+//   g++ -shared -fPIC -O2 -Iheaders -Ifunctions \
+//       /path/to/mlx90640_capi.cpp -o libMLX90640_API.so
+extern "C" {
+#include "MLX90640_API.h"
+#include "MLX90640_I2C_Driver.h"
+}
+
+#include "MLX90640_API.cpp"
+#include "MLX90640_LINUX_I2C_Driver.cpp"
@@ -0,0 +1,111 @@
+"""Numba kernels for the MLX90641 thermal hot paths.
+
+Numba is optional: when it cannot be imported ``NUMBA_AVAILABLE`` is False
+and callers fall back to the equivalent NumPy implementations in utils.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in decorator that leaves the function uncompiled"""
+        return lambda func: func
+
+
+# The range and render kernels must see NaN and inf to skip them, so they
+# are compiled without fastmath's finite-math assumption
+@njit(cache=True)
+def minmax(frame: np.ndarray):
+    """Minimum and maximum of the finite values of a flat frame in one pass."""
+    lo = np.inf
+    hi = -np.inf
+    for v in frame:
+        if not np.isfinite(v):
+            continue
+        if v < lo:
+            lo = v
+        if v > hi:
+            hi = v
+    if lo > hi:
+        # No finite pixels at all
+        return frame.dtype.type(0), frame.dtype.type(0)
+    return frame.dtype.type(lo), frame.dtype.type(hi)
+
+
+@njit(cache=True)
+def palette_index(t, lo, scale) -> int:
+    """0-255 palette index for t, with non-finite pixels mapped to 0."""
+    if not np.isfinite(t):
+        return 0
+    idx = int((t - lo) * scale)
+    if idx < 0:
+        return 0
+    if idx > 255:
+        return 255
+    return idx
+
+
+# Explicit signature so the kernel is compiled at import, not on first frame
+@njit("void(float32[::1], uint8[::1])", cache=True)
+def normalize_frame(frame: np.ndarray, out: np.ndarray) -> None:
+    """Scale frame to the 0-255 range into out in one fused min/max/scale loop."""
+    lo, hi = minmax(frame)
+    scale = 255.0 / max(hi - lo, 1e-6)
+    for i in range(frame.size):
+        out[i] = palette_index(frame[i], lo, scale)
+
+
+@njit(cache=True, nogil=True)
+def render_thermal(
+        temps: np.ndarray,
+        palette: np.ndarray,
+        resize_idx: np.ndarray,
+        out: np.ndarray) -> None:
+    """
+    Normalize, resize and colorize a frame in one pass.
+    Reads each source temperature through resize_idx and writes the palette
+    colour straight into out, a preallocated (height, width, 3) uint8 array.
+    """
+    tmin, tmax = minmax(temps)
+    inv_span = 255.0 / max(tmax - tmin, 1e-6)
+
+    flat = out.reshape(-1, 3)
+    for i in range(resize_idx.size):
+        idx = palette_index(temps[resize_idx[i]], tmin, inv_span)
+        flat[i, 0] = palette[idx, 0]
+        flat[i, 1] = palette[idx, 1]
+        flat[i, 2] = palette[idx, 2]
+
+
+# Eager signature for the ring slot views get_readings passes, so the
+# first reading does not pay the compile
+@njit(
+    "Tuple((float32[::1], float32[::1], float32, float32, float32, float32))(float32[::1])",
+    cache=True)
+def derive_readings(celsius: np.ndarray):
+    """
+    Derive the Fahrenheit frame, its row-mirrored copy and the min/max of
+    the finite pixels in both units from a 24x32 Celsius frame.
+    """
+    fahrenheit = np.empty_like(celsius)
+    mirrored = np.empty_like(celsius)
+    for i in range(24):
+        base = i * 32
+        for j in range(32):
+            c = celsius[base + j]
+            f = c * np.float32(1.8) + np.float32(32.0)
+            fahrenheit[base + j] = f
+            mirrored[base + 31 - j] = f
+    min_c, max_c = minmax(celsius)
+    return (
+        fahrenheit,
+        mirrored,
+        min_c,
+        max_c,
+        min_c * np.float32(1.8) + np.float32(32.0),
+        max_c * np.float32(1.8) + np.float32(32.0),
+    )
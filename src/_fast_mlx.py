@@ -0,0 +1,202 @@
+"""Faster drop-in subclass of the adafruit MLX90640 driver.
+
+Overrides the pure Python hot spots of adafruit_mlx90640 with NumPy
+equivalents while keeping its I2C handling and public API.
+"""
+import math
+import time
+from typing import List, Optional, Union
+
+import adafruit_mlx90640
+import numpy as np
+from busio import I2C
+
+
+class FastMLX90640(adafruit_mlx90640.MLX90640):
+    """adafruit_mlx90640.MLX90640 with vectorized word decoding and calibration."""
+
+    # time.monotonic_ns() when the last subpage read by getFrame was ready
+    subpage_ready_ns: int = 0
+
+    def __init__(self, i2c_bus: I2C, address: int = 0x33) -> None:
+        # Transfer buffers are reused by every read, including the status
+        # register polling in _GetFrameData, and must exist before the base
+        # class reads the EEPROM
+        self._addrbuf = bytearray(2)
+        self._inbuf = bytearray(2 * adafruit_mlx90640.I2C_READ_LEN)
+        # Raw subpage words; int32 so the driver's sign fix-ups cannot overflow
+        self._frame_words = np.zeros(834, dtype=np.int32)
+        self._status_word = [0]
+        super().__init__(i2c_bus, address)
+        self._prepare_pixel_coefficients()
+
+    def _prepare_pixel_coefficients(self) -> None:
+        """Turn the per-pixel EEPROM calibration into arrays, once."""
+        pixel = np.arange(768)
+        il_pattern = pixel // 32 - (pixel // 64) * 2
+        conversion_pattern = (
+            (pixel + 2) // 4 - (pixel + 3) // 4 + (pixel + 1) // 4 - pixel // 4
+        ) * (1 - 2 * il_pattern)
+
+        self._il_pattern = il_pattern
+        self._chess_pattern = il_pattern ^ (pixel % 2)
+        self._il_chess_correction = (
+            self.ilChessC[2] * (2 * il_pattern - 1)
+            - self.ilChessC[1] * conversion_pattern
+        )
+        self._bad_pixels = np.isin(pixel, self.brokenPixels + self.outlierPixels)
+
+        self._offset = np.asarray(self.offset, dtype=np.float64)
+        self._kta = np.asarray(self.kta, dtype=np.float64) / math.pow(2, self.ktaScale)
+        self._kv = np.asarray(self.kv, dtype=np.float64) / math.pow(2, self.kvScale)
+        with np.errstate(divide="ignore"):
+            self._alpha = (
+                adafruit_mlx90640.SCALEALPHA * math.pow(2, self.alphaScale)
+                / np.asarray(self.alpha, dtype=np.float64)
+            )
+
+        self._ct = np.asarray(self.ct[:4], dtype=np.float64)
+        self._ks_to = np.asarray(self.ksTo[:4], dtype=np.float64)
+        alpha_corr_2 = 1 + self.ksTo[1] * self.ct[2]
+        self._alpha_corr_r = np.array([
+            1 / (1 + self.ksTo[0] * 40),
+            1,
+            alpha_corr_2,
+            alpha_corr_2 * (1 + self.ksTo[2] * (self.ct[3] - self.ct[2])),
+        ])
+
+    def getFrame(self, framebuf: Union[List[float], np.ndarray]) -> None:
+        """Read both subpages and calculate the temperature in C of all 768 pixels."""
+        emissivity = 0.95
+        frame_words = self._frame_words
+        status_word = self._status_word
+
+        for _ in range(2):
+            # Poll for the subpage here to timestamp when it became ready;
+            # _GetFrameData then finds it ready on its first status read
+            status_word[0] = 0
+            while not status_word[0] & 0x0008:
+                self._I2CReadWords(0x8000, status_word)
+            self.subpage_ready_ns = time.monotonic_ns()
+
+            status = self._GetFrameData(frame_words)
+            if status < 0:
+                raise RuntimeError("Frame data error")
+            # For a MLX90640 in the open air the shift is -8 degC.
+            tr = self._GetTa(frame_words) - adafruit_mlx90640.OPENAIR_TA_SHIFT
+            self._CalculateTo(frame_words, emissivity, tr, framebuf)
+
+    def _CalculateTo(
+            self,
+            frameData: Union[List[int], np.ndarray],
+            emissivity: float,
+            tr: float,
+            result: Union[List[float], np.ndarray]) -> None:
+        """
+        Vectorized port of the adafruit per-pixel temperature calculation.
+        Every pixel of the current subpage is computed in one set of NumPy
+        expressions over the coefficient arrays from
+        _prepare_pixel_coefficients. Non-ndarray outputs use the original.
+        """
+        if not isinstance(result, np.ndarray) or not isinstance(frameData, np.ndarray):
+            super()._CalculateTo(frameData, emissivity, tr, result)
+            return
+
+        sub_page = int(frameData[833])
+        vdd = self._GetVdd(frameData)
+        ta = self._GetTa(frameData)
+
+        ta4 = (ta + 273.15) ** 4
+        tr4 = (tr + 273.15) ** 4
+        ta_tr = tr4 - (tr4 - ta4) / emissivity
+
+        # --------- Gain calculation -----------------------------------
+        gain = int(frameData[778])
+        if gain > 32767:
+            gain -= 65536
+        gain = self.gainEE / gain
+
+        # --------- Compensation pixels --------------------------------
+        mode = (int(frameData[832]) & 0x1000) >> 5
+        ta_vdd_cp = (1 + self.cpKta * (ta - 25)) * (1 + self.cpKv * (vdd - 3.3))
+        ir_data_cp = []
+        for i, word in enumerate((int(frameData[776]), int(frameData[808]))):
+            if word > 32767:
+                word -= 65536
+            cp_offset = self.cpOffset[i]
+            if i == 1 and mode != self.calibrationModeEE:
+                cp_offset += self.ilChessC[0]
+            ir_data_cp.append(word * gain - cp_offset * ta_vdd_cp)
+
+        # --------- To calculation -------------------------------------
+        ir_data = frameData[:768].astype(np.int16).astype(np.float64) * gain
+        ir_data -= self._offset * (1 + self._kta * (ta - 25)) * (1 + self._kv * (vdd - 3.3))
+        if mode != self.calibrationModeEE:
+            ir_data += self._il_chess_correction
+        ir_data -= self.tgc * ir_data_cp[sub_page]
+        ir_data /= emissivity
+
+        # Only good pixels of this subpage are calculated, as in the original
+        pattern = self._il_pattern if mode == 0 else self._chess_pattern
+        update = (pattern == sub_page) & ~self._bad_pixels
+        ir_data = ir_data[update]
+
+        alpha_compensated = self._alpha[update] * (1 + self.KsTa * (ta - 25))
+        ks_to_1 = self.ksTo[1]
+        sx = alpha_compensated ** 3 * (ir_data + alpha_compensated * ta_tr)
+        sx = np.sqrt(np.sqrt(sx)) * ks_to_1
+        to = np.sqrt(np.sqrt(
+            ir_data / (alpha_compensated * (1 - ks_to_1 * 273.15) + sx) + ta_tr
+        )) - 273.15
+
+        torange = np.searchsorted(self._ct[1:4], to, side="right")
+        to = np.sqrt(np.sqrt(
+            ir_data / (
+                alpha_compensated
+                * self._alpha_corr_r[torange]
+                * (1 + self._ks_to[torange] * (to - self._ct[torange]))
+            ) + ta_tr
+        )) - 273.15
+
+        # The original's math.sqrt raises on these; do the same so the
+        # reader retries instead of publishing NaNs
+        if not np.isfinite(to).all():
+            raise ValueError("math domain error")
+
+        result[update] = to
+        result[self._bad_pixels] = -273.15
+
+    def _I2CReadWords(
+            self,
+            addr: int,
+            buffer: Union[List[int], np.ndarray],
+            *,
+            end: Optional[int] = None) -> None:
+        """
+        Read 16-bit words starting at addr into buffer.
+        The device sends big-endian words, so each chunk is decoded with a
+        single byteswapping np.frombuffer and stored with one slice
+        assignment instead of a per-word Python loop. Array buffers take
+        the words directly; the EEPROM and status lists get Python ints.
+        """
+        remaining_words = len(buffer) if end is None else end
+        offset = 0
+        addrbuf = self._addrbuf
+        inbuf = self._inbuf
+
+        with self.i2c_device as i2c:
+            while remaining_words:
+                addrbuf[0] = addr >> 8  # MSB
+                addrbuf[1] = addr & 0xFF  # LSB
+                read_words = min(remaining_words, adafruit_mlx90640.I2C_READ_LEN)
+                i2c.write_then_readinto(addrbuf, inbuf, in_end=read_words * 2)
+
+                # Zero-copy view over the bytes just read
+                words = np.frombuffer(inbuf, dtype=">u2", count=read_words)
+                if isinstance(buffer, np.ndarray):
+                    buffer[offset:offset + read_words] = words
+                else:
+                    buffer[offset:offset + read_words] = words.tolist()
+                offset += read_words
+                remaining_words -= read_words
+                addr += read_words
@@ -0,0 +1,120 @@
+"""ctypes bindings for the melexis mlx90640-library C driver.
+
+The native library does the I2C transfers and per-pixel calibration in C,
+which is much cheaper than the pure Python math in adafruit_mlx90640.
+It is optional: set MLX90640_LIBRARY to the path of a built
+libMLX90640_API.so, or install it where ctypes can find it. When it cannot
+be loaded, or was built without the C linkage shim in
+native/mlx90640_capi.cpp, ``NATIVE_AVAILABLE`` is False and the adafruit
+driver is used.
+"""
+import ctypes
+import ctypes.util
+import logging
+import os
+import time
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MLX90640_ADDRESS = 0x33
+EEPROM_WORDS = 832
+FRAME_WORDS = 834
+EMISSIVITY = 0.95
+OPENAIR_TA_SHIFT = 8
+# Opaque storage for the library's paramsMLX90640 struct, which is ~5 kB
+PARAMS_BUFFER_SIZE = 8192
+
+_u16_p = ctypes.POINTER(ctypes.c_uint16)
+_float_p = ctypes.POINTER(ctypes.c_float)
+
+
+def _load_library() -> Optional[ctypes.CDLL]:
+    path = os.environ.get("MLX90640_LIBRARY") or ctypes.util.find_library("MLX90640_API")
+    if not path:
+        return None
+    try:
+        lib = ctypes.CDLL(path)
+    except OSError as e:
+        logger.warning("Could not load MLX90640 library %s: %s", path, e)
+        return None
+
+    # A plain g++ build of the library exports C++-mangled names, so a
+    # missing symbol means it was built without native/mlx90640_capi.cpp
+    try:
+        lib.MLX90640_DumpEE.argtypes = [ctypes.c_uint8, _u16_p]
+        lib.MLX90640_DumpEE.restype = ctypes.c_int
+        lib.MLX90640_ExtractParameters.argtypes = [_u16_p, ctypes.c_void_p]
+        lib.MLX90640_ExtractParameters.restype = ctypes.c_int
+        lib.MLX90640_SetRefreshRate.argtypes = [ctypes.c_uint8, ctypes.c_uint8]
+        lib.MLX90640_SetRefreshRate.restype = ctypes.c_int
+        lib.MLX90640_GetFrameData.argtypes = [ctypes.c_uint8, _u16_p]
+        lib.MLX90640_GetFrameData.restype = ctypes.c_int
+        lib.MLX90640_GetTa.argtypes = [_u16_p, ctypes.c_void_p]
+        lib.MLX90640_GetTa.restype = ctypes.c_float
+        lib.MLX90640_CalculateTo.argtypes = [
+            _u16_p, ctypes.c_void_p, ctypes.c_float, ctypes.c_float, _float_p]
+        lib.MLX90640_CalculateTo.restype = None
+        lib.MLX90640_I2CFreqSet.argtypes = [ctypes.c_int]
+        lib.MLX90640_I2CFreqSet.restype = None
+    except AttributeError as e:
+        logger.warning(
+            "MLX90640 library %s lacks C symbols, build it with "
+            "native/mlx90640_capi.cpp: %s", path, e)
+        return None
+    return lib
+
+
+_lib = _load_library()
+NATIVE_AVAILABLE = _lib is not None
+
+
+class NativeMLX90640:
+    """Drop-in replacement for adafruit_mlx90640.MLX90640's getFrame."""
+
+    # time.monotonic_ns() when the last subpage read by getFrame was
+    # requested. The library polls for data ready internally, so this is
+    # an upper bound on its age and callers sleeping from it wake early.
+    subpage_ready_ns: int = 0
+
+    def __init__(self, frequency: int, refresh_rate: int, address: int = MLX90640_ADDRESS):
+        if _lib is None:
+            raise RuntimeError("MLX90640 native library is not available")
+        self._address = address
+        self._params = ctypes.create_string_buffer(PARAMS_BUFFER_SIZE)
+        self._frame_words = np.zeros(FRAME_WORDS, dtype=np.uint16)
+        self._frame_words_p = self._frame_words.ctypes.data_as(_u16_p)
+
+        _lib.MLX90640_I2CFreqSet(frequency // 1000)
+        ee_data = np.zeros(EEPROM_WORDS, dtype=np.uint16)
+        if _lib.MLX90640_DumpEE(address, ee_data.ctypes.data_as(_u16_p)) != 0:
+            raise OSError("Failed to read MLX90640 EEPROM")
+        if _lib.MLX90640_ExtractParameters(ee_data.ctypes.data_as(_u16_p), self._params) != 0:
+            raise OSError("Failed to extract MLX90640 calibration parameters")
+        self.refresh_rate = refresh_rate
+
+    @property
+    def refresh_rate(self) -> int:
+        return self._refresh_rate
+
+    @refresh_rate.setter
+    def refresh_rate(self, rate: int) -> None:
+        if _lib.MLX90640_SetRefreshRate(self._address, int(rate)) != 0:
+            raise OSError("Failed to set MLX90640 refresh rate")
+        self._refresh_rate = int(rate)
+
+    def getFrame(self, framebuf: np.ndarray) -> None:
+        """Read both subpages and write calibrated Celsius values into framebuf."""
+        out = framebuf.ctypes.data_as(_float_p)
+        for _ in range(2):
+            self.subpage_ready_ns = time.monotonic_ns()
+            if _lib.MLX90640_GetFrameData(self._address, self._frame_words_p) < 0:
+                raise OSError("Failed to read MLX90640 frame data")
+            tr = _lib.MLX90640_GetTa(self._frame_words_p, self._params) - OPENAIR_TA_SHIFT
+            _lib.MLX90640_CalculateTo(self._frame_words_p, self._params, EMISSIVITY, tr, out)
+        # The C library has no domain checks; treat a NaN/inf frame as a
+        # failed read like the Python driver does, so the reader retries
+        if not np.isfinite(framebuf).all():
+            raise ValueError("MLX90640 returned non-finite temperatures")
@@ -2,15 +2,20 @@
 """MLX90641 IR Thermal Sensor and Camera Components."""
 
 import asyncio
+import base64
+import io
 import logging
 import os
 import time
-from threading import Event, Lock, Thread
-from typing import Any, ClassVar, Dict, List, Mapping, Optional, Tuple, Sequence, cast
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Event
+from typing import Any, ClassVar, Dict, List, Mapping, Optional, Tuple, Sequence, Union, cast
 
 import adafruit_mlx90640
 import board
 import busio
+import numpy as np
 from typing_extensions import Self
 from viam.components.camera import Camera
 from viam.components.sensor import Sensor
@@ -22,8 +27,10 @@ from viam.proto.component.camera import GetPropertiesResponse
 from viam.resource.base import ResourceBase
 from viam.resource.easy_resource import EasyResource
 from viam.resource.types import Model, ModelFamily
-from viam.utils import SensorReading
+from viam.utils import SensorReading, ValueTypes
 
+import _fast_mlx
+import _mlx_native
 import utils
 
 logger = logging.getLogger(__name__)
@@ -40,7 +47,23 @@ REFRESH_RATE_MAP = {
     64: adafruit_mlx90640.RefreshRate.REFRESH_64_HZ,
 }
 
-CACHE_DURATION = 0.001  # 1ms cache duration
+DEFAULT_REFRESH_RATE = 4
+
+# Raspberry Pi I2C character devices; board.SCL/SDA map to bus 1
+I2C_DEVICES = ("/dev/i2c-1", "/dev/i2c-0")
+MAX_I2C_FREQUENCY = 1000000  # 1 MHz fast mode plus, the MLX90640 maximum
+
+IMAGE_WIDTH = 240
+IMAGE_HEIGHT = 320
+
+CACHE_DURATION_NS = 1_000_000  # 1ms cache duration for remote sensors
+# Fraction of a refresh period, counted from when the last subpage was
+# ready, that the reader sleeps before polling for the next one
+READER_SLEEP_FRACTION = 0.9
+FRAME_RING_SIZE = 8  # Number of recent frames kept by the sensor
+# Frames to wait for the first reading when the caller gives no timeout;
+# each frame is two subpages, so two refresh periods
+FIRST_FRAME_WAIT_FRAMES = 4
 MAX_RETRIES = 3
 BASE_DELAY = 0.05  # Base delay between retries in seconds
 
@@ -52,14 +75,29 @@ class MlxSensor(Sensor, EasyResource):
         ModelFamily("rand", "waveshare-thermal"), "mlx90641-ir-sensor"
     )
 
-    mlx : adafruit_mlx90640.MLX90640
-    _frame_lock = Lock()
-    _stop_event = Event()
-    _read_thread: Optional[Thread] = None
-    _frame_buffer: List[float] = [0]*768
-    # Add cache attributes
-    _last_frame: Optional[List[float]] = [0]*768
-    _last_reading_time: float = 0
+    # Sensors created in this module process by name. The SDK hands cameras
+    # a gRPC client for their dependency, so this is how a camera finds the
+    # in-process sensor and its frame buffer
+    _local_instances: ClassVar[Dict[str, "MlxSensor"]] = {}
+
+    mlx : Union[_fast_mlx.FastMLX90640, _mlx_native.NativeMLX90640]
+    _i2c: Optional[busio.I2C] = None
+    # Each reader gets its own stop event, so stopping one sensor's reader
+    # never stops or revives another's
+    _stop_event: Optional[Event] = None
+    refresh_rate: float = DEFAULT_REFRESH_RATE
+    _reader_sleep_ns: int = 0
+    # Frames are read on a single-worker executor and published back on the
+    # event loop, so readers never need a lock
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _executor: Optional[ThreadPoolExecutor] = None
+    _frame_event: asyncio.Event
+    # Ring of recent frames: the reader fills the next slot, then publishes
+    # it on the event loop by bumping _frame_seq
+    _frame_ring: np.ndarray = np.zeros((FRAME_RING_SIZE, 768), dtype=np.float32)
+    # Count of frames written, also used to memoize derived readings
+    _frame_seq: int = 0
+    _cached_readings: Optional[Tuple[Tuple[int, bool], Mapping[str, SensorReading]]] = None
 
     @classmethod
     def new(
@@ -69,52 +107,94 @@ class MlxSensor(Sensor, EasyResource):
         """Create a new MLX90640 sensor instance."""
         mlxsensor = cls(config.name)
         mlxsensor.reconfigure(config, dependencies)
+        cls._local_instances[config.name] = mlxsensor
         return mlxsensor
 
-    def _start_reading(self):
-        if self._read_thread and self._read_thread.is_alive():
+    @classmethod
+    def get_local(cls, name: str) -> Optional["MlxSensor"]:
+        """Return the sensor named name if it lives in this process."""
+        return cls._local_instances.get(name)
+
+    def _stop_reading(self):
+        if self._executor is not None:
             self._stop_event.set()
-            self._read_thread.join()
-        self._stop_event.clear()
-        self._read_thread = Thread(target=self._read_frame, daemon=True)
-        self._read_thread.start()
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _release_i2c(self):
+        if self._i2c is not None:
+            self._i2c.deinit()
+            self._i2c = None
+
+    def _reset_frames(self):
+        """Forget all frames; readers wait for the next reader's first one."""
+        # MLX90640 has 768 pixels
+        self._frame_ring = np.zeros((FRAME_RING_SIZE, 768), dtype=np.float32)
+        self._frame_seq = 0
+        self._cached_readings = None
+        self._frame_event = asyncio.Event()
 
-    def _read_frame(self):
-        """Continuously read frames from MLX sensor with retry logic"""
+    def _start_reading(self):
+        self._stop_reading()
+        self._stop_event = Event()
+        self._loop = asyncio.get_event_loop()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mlx90640")
+        self._loop.run_in_executor(
+            self._executor, self._read_frame, self._frame_ring, self._stop_event)
+
+    def _publish_frame(self, ring: np.ndarray, seq: int):
+        """Make frame seq visible to readers; runs on the event loop."""
+        # A reader stopped by reconfigure can still have a publish queued;
+        # its ring has been replaced, so drop it
+        if ring is not self._frame_ring:
+            return
+        self._frame_seq = seq
+        self._frame_event.set()
+
+    def _read_frame(self, ring: np.ndarray, stop_event: Event):
+        """Continuously read frames from MLX sensor into ring with retry logic"""
         retry_count = 0
+        write_seq = self._frame_seq
 
-        while not self._stop_event.is_set():
+        while not stop_event.is_set():
             try:
-                current_time = time.time()
-                # Check cache first
-                if (current_time - self._last_reading_time) < CACHE_DURATION:
-                    time.sleep(0.001)  # Small sleep to prevent tight loop
-                    continue
-
                 # Read frame from sensor
-                start_time = time.time()
-                self.mlx.getFrame(self._frame_buffer)
-
-                # Log success and reset retry count
-                read_time = (time.time() - start_time) * 1000
-                logger.debug(f"Frame read successful in {read_time:.1f}ms")
+                start_time = time.monotonic_ns()
+                self.mlx.getFrame(ring[write_seq % FRAME_RING_SIZE])
+
+                # Log success and reset retry count, only formatting the
+                # timing when debug logging is enabled
+                if logger.isEnabledFor(logging.DEBUG):
+                    read_time = (time.monotonic_ns() - start_time) / 1e6
+                    logger.debug("Frame read successful in %.1fms", read_time)
                 retry_count = 0
 
-                # Update frame buffer with lock
-                with self._frame_lock:
-                    self._last_frame = self._frame_buffer.copy()
-                    self._last_reading_time = time.time()
+                # Publish the new frame on the event loop
+                write_seq += 1
+                self._loop.call_soon_threadsafe(
+                    self._publish_frame, ring, write_seq)
+
+                # Sleep until the next subpage is nearly due instead of
+                # polling, less the time spent reading and calculating the
+                # last one; close() wakes this through the stop event
+                elapsed_ns = time.monotonic_ns() - self.mlx.subpage_ready_ns
+                sleep_ns = self._reader_sleep_ns - elapsed_ns
+                if sleep_ns > 0:
+                    stop_event.wait(sleep_ns / 1e9)
 
             except (OSError, Exception) as e:
                 retry_count += 1
-                logger.error(f"Frame read failed: {e} (retry {retry_count})")
+                logger.error("Frame read failed: %s (retry %d)", e, retry_count)
 
+                # Back off for at least one sensor frame period; waiting on
+                # the stop event lets close() interrupt the backoff
+                retry_delay = max(BASE_DELAY, 1 / self.refresh_rate)
                 if retry_count >= MAX_RETRIES:
                     logger.error("Max retries exceeded, waiting longer...")
-                    time.sleep(BASE_DELAY * 2)
+                    stop_event.wait(retry_delay * 2)
                     retry_count = 0
                 else:
-                    time.sleep(BASE_DELAY)
+                    stop_event.wait(retry_delay)
 
     def reconfigure(
             self,
@@ -122,40 +202,56 @@ class MlxSensor(Sensor, EasyResource):
             dependencies: Mapping[ResourceName, ResourceBase]):
         """Reconfigure the MLX90640 sensor."""
         # Check for I2C buses
-        i2c_buses = [f"/dev/{file}" for file in os.listdir("/dev") if file.startswith("i2c-")]
-        if not i2c_buses:
+        if not any(os.path.exists(device) for device in I2C_DEVICES):
             raise Exception(
                 "i2c not enabled on your device, we tried enabling it through modprobe" +
                 "please ssh into your pi and enable it through sudo raspi-config")
 
-        # Initialize I2C bus
-        i2c = busio.I2C(board.SCL, board.SDA, frequency=1000000)
-
-        # Initialize the MLX90640 sensor
-        mlx = adafruit_mlx90640.MLX90640(i2c)
-        time.sleep(0.1)  # Allow calibration to take effect
+        # The driver and I2C bus are created once here and kept on self, so
+        # stop the reader and release the old bus before replacing them.
+        # Frames from the old driver are dropped first: if building the new
+        # one fails, callers get the first-frame timeout, not a frozen frame
+        self._stop_reading()
+        self._release_i2c()
+        self._reset_frames()
 
         # Set the refresh rate
         refresh_rate = config.attributes.fields["refresh_rate_hz"].number_value
+        if refresh_rate and refresh_rate not in REFRESH_RATE_MAP:
+            logger.warning(
+                "Invalid refresh rate %sHz, using %sHz", refresh_rate, DEFAULT_REFRESH_RATE)
+        if refresh_rate not in REFRESH_RATE_MAP:
+            refresh_rate = DEFAULT_REFRESH_RATE
 
         # Store refresh rate for delay calculations
         self.refresh_rate = refresh_rate
+        self._reader_sleep_ns = int(READER_SLEEP_FRACTION * 1e9 / refresh_rate)
 
-        # Set refresh rate with fallback
-        try:
-            mlx.refresh_rate = REFRESH_RATE_MAP.get(
-                refresh_rate,
-                adafruit_mlx90640.RefreshRate.REFRESH_4_HZ  # default fallback
-            )
-            time.sleep(0.1)  # Allow settings to take effect
+        # I2C clock, clamped to what the sensor supports
+        i2c_frequency = int(config.attributes.fields["i2c_freq_hz"].number_value)
+        if i2c_frequency <= 0 or i2c_frequency > MAX_I2C_FREQUENCY:
+            i2c_frequency = MAX_I2C_FREQUENCY
+
+        rate_setting = REFRESH_RATE_MAP[refresh_rate]
+
+        mlx: Union[_fast_mlx.FastMLX90640, _mlx_native.NativeMLX90640]
+        if _mlx_native.NATIVE_AVAILABLE:
+            # Native C driver does I2C reads and calibration outside Python
+            mlx = _mlx_native.NativeMLX90640(frequency=i2c_frequency, refresh_rate=rate_setting)
+            logger.info("Using native MLX90640 driver")
+        else:
+            # Initialize I2C bus
+            self._i2c = busio.I2C(board.SCL, board.SDA, frequency=i2c_frequency)
 
-        except KeyError:
-            print(f"Invalid refresh rate {refresh_rate}Hz, using 4Hz")
-            mlx.refresh_rate = adafruit_mlx90640.RefreshRate.REFRESH_4_HZ
+            # Initialize the MLX90640 sensor
+            mlx = _fast_mlx.FastMLX90640(self._i2c)
+            time.sleep(0.1)  # Allow calibration to take effect
+
+            mlx.refresh_rate = rate_setting
+        time.sleep(0.1)  # Allow settings to take effect
 
         # Update instance variables
         self.mlx = mlx
-        self._frame_buffer = [0]*768  # MLX90640 has 768 pixels
 
         self._start_reading()
 
@@ -167,34 +263,134 @@ class MlxSensor(Sensor, EasyResource):
     **kwargs
     ) -> Mapping[str, SensorReading]:
 
-        with self._frame_lock:
-            frame = self._last_frame.copy()
-
-        # Convert frame data to readings
-        readings_celsius = frame
-        readings_fahrenheit = [(temp * 9/5) + 32 for temp in readings_celsius]
-
-        # Convert 1D to 2D (24x32), mirror each row, flatten
-        rows = [readings_fahrenheit[i:i+32] for i in range(0, len(readings_fahrenheit), 32)]
-        mirrored = [x for row in rows for x in reversed(row)]
+        seq = await self._wait_for_frame(timeout)
+        # Callers that only need Celsius can skip the Fahrenheit derivations
+        include_fahrenheit = bool((extra or {}).get("include_fahrenheit", True))
+        cache_key = (seq, include_fahrenheit)
+        cached = self._cached_readings
+        if cached and cached[0] == cache_key:
+            return cached[1]
+        # Zero-copy view: the reader only writes slots past the published
+        # sequence, so this one is stable for FRAME_RING_SIZE - 1 frames
+        frame = self._frame_ring[(seq - 1) % FRAME_RING_SIZE]
+
+        readings: Dict[str, SensorReading]
+        if not include_fahrenheit:
+            min_c, max_c = utils.frame_range(frame)
+            readings = {
+                "all_temperatures_celsius": frame.tolist(),
+                "min_temp_celsius": min_c,
+                "max_temp_celsius": max_c,
+                }
+        else:
+            # Convert frame data to readings in a single pass
+            (readings_fahrenheit, mirrored,
+             min_c, max_c, min_f, max_f) = utils.derive_readings(frame)
+
+            readings = {
+                "all_temperatures_celsius": frame.tolist(),
+                "all_temperatures_fahrenheit": readings_fahrenheit.tolist(),
+                "all_temperatures_fahrenheit_mirrored": mirrored.tolist(),
+                "min_temp_celsius": float(min_c),
+                "max_temp_celsius": float(max_c),
+                "min_temp_fahrenheit": float(min_f),
+                "max_temp_fahrenheit": float(max_f),
+                }
+        self._cached_readings = (cache_key, readings)
+
+        return readings
+
+    @property
+    def frame_seq(self) -> int:
+        """Number of frames read since the last reconfigure."""
+        return self._frame_seq
+
+    @property
+    def frame_key(self) -> Tuple[np.ndarray, int]:
+        """
+        The ring and sequence number of the latest frame. The ring is
+        replaced on reconfigure, so the pair still identifies a frame
+        after frame_seq restarts from zero.
+        """
+        return self._frame_ring, self._frame_seq
+
+    async def _wait_for_frame(self, timeout: Optional[float] = None) -> int:
+        """
+        Return the latest frame sequence number, waiting for the first frame.
+        Without a timeout the wait is bounded to a few sensor frames, so a
+        sensor that never produces one fails the call instead of hanging it.
+        """
+        if self._frame_seq == 0:
+            if timeout is None:
+                timeout = FIRST_FRAME_WAIT_FRAMES * 2 / self.refresh_rate
+            # Wait for the first frame rather than reporting an empty one
+            try:
+                await asyncio.wait_for(self._frame_event.wait(), timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError(
+                    f"No frame from the MLX90640 within {timeout:.1f}s") from None
+        return self._frame_seq
 
-        return {
-            "all_temperatures_celsius": readings_celsius,
-            "all_temperatures_fahrenheit": readings_fahrenheit,
-            "all_temperatures_fahrenheit_mirrored": mirrored,
-            "min_temp_celsius": min(readings_celsius),
-            "max_temp_celsius": max(readings_celsius),
-            "min_temp_fahrenheit": min(readings_fahrenheit),
-            "max_temp_fahrenheit": max(readings_fahrenheit),
-            }
+    async def get_frame(
+            self,
+            unit: str = "C",
+            mirror: bool = False,
+            timeout: Optional[float] = None) -> np.ndarray:
+        """
+        Return a copy of the latest frame as a flat float32 array.
+        In-process fast path for the camera: only the requested unit and
+        orientation are computed, without building the readings dict.
+        """
+        seq = await self._wait_for_frame(timeout)
+        frame = self._frame_ring[(seq - 1) % FRAME_RING_SIZE].reshape(24, 32)
+        if mirror:
+            frame = frame[:, ::-1]
+
+        # Always hand back a fresh contiguous array, never the ring slot
+        result = np.array(frame, dtype=np.float32, order="C").ravel()
+        if unit == "F":
+            result *= utils.FAHRENHEIT_SCALE
+            result += utils.FAHRENHEIT_OFFSET
+        return result
+
+    def get_recent_frames(self, count: int = FRAME_RING_SIZE - 1) -> np.ndarray:
+        """Return up to count of the most recent Celsius frames, oldest first."""
+        seq = self._frame_seq
+        # The slot after the newest frame is the one the reader is filling
+        count = min(count, seq, FRAME_RING_SIZE - 1)
+        slots = np.arange(seq - count, seq) % FRAME_RING_SIZE
+        return self._frame_ring[slots]
+
+    async def do_command(
+        self,
+        command: Mapping[str, ValueTypes],
+        *,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> Mapping[str, ValueTypes]:
+        """
+        {"get_raw": true} returns the latest Celsius frame as base64-encoded
+        little-endian float32, a fraction of the size of the readings lists.
+        """
+        if command.get("get_raw"):
+            seq = await self._wait_for_frame(timeout)
+            frame = self._frame_ring[(seq - 1) % FRAME_RING_SIZE]
+            return {
+                "frame_f32_le": base64.b64encode(
+                    frame.astype("<f4", copy=False).tobytes()).decode("ascii"),
+                "height": utils.FRAME_HEIGHT,
+                "width": utils.FRAME_WIDTH,
+                "frame_seq": seq,
+                }
+        raise ValueError(f"Unknown command: {list(command)}")
 
     async def close(self):
-        """Stop the frame reading thread."""
-        print("Closing MLX90640 sensor")
-        if self._read_thread:
-            self._stop_event.set()
-            self._read_thread.join()
-            self._read_thread = None
+        """Stop the frame reading loop."""
+        logger.info("Closing MLX90640 sensor")
+        if self._local_instances.get(self.name) is self:
+            del self._local_instances[self.name]
+        self._stop_reading()
+        self._release_i2c()
 
 ## Implementation of the Mlx90641 Camera
 ## this uses the sensor to create an resized image so you can see
@@ -206,10 +402,22 @@ class MlxCamera(Camera, EasyResource):
         ModelFamily("rand", "waveshare-thermal"), "mlx90641-ir-camera"
     )
     mlxsensor : Sensor
-    heatmap_palette: List[int]
-    _last_reading_time: float = 0
+    _sensor_name: str = ""
+    heatmap_palette: np.ndarray
+    _resize_idx: np.ndarray
+    _rgb_out: np.ndarray
+    _encode_buffer: io.BytesIO
+    _render_lock: asyncio.Lock
+    _last_reading_time: int = 0  # time.monotonic_ns()
     _cached_image: Optional[ViamImage] = None
+    _cached_mime_type: str = ""
+    _cached_frame_key: Optional[Tuple[np.ndarray, int]] = None
     _flipped: bool = False
+    _png_compress_level: int = 0
+    _properties: ClassVar[GetPropertiesResponse] = GetPropertiesResponse(
+        supports_pcd=False,
+        mime_types=[*utils.IMAGE_FORMATS, utils.RGBA_MIME_TYPE],
+    )
 
     @classmethod
     def new(
@@ -217,6 +425,7 @@ class MlxCamera(Camera, EasyResource):
       dependencies: Mapping[ResourceName, ResourceBase]
       ) -> Self:
         mlxcamera = cls(config.name)
+        mlxcamera._render_lock = asyncio.Lock()
         mlxcamera.reconfigure(config, dependencies)
         return mlxcamera
 
@@ -233,12 +442,21 @@ class MlxCamera(Camera, EasyResource):
 
         sensor = dependencies[Sensor.get_resource_name(sensor_name)]
         self.mlxsensor = cast(Sensor, sensor)
-        self.heatmap_palette = utils.create_heatmap_palette()
+        self._sensor_name = sensor_name
+        self.heatmap_palette = utils.create_heatmap_lut()
+        self._resize_idx = utils.create_resize_index(IMAGE_WIDTH, IMAGE_HEIGHT)
+        self._rgb_out = np.empty((IMAGE_HEIGHT, IMAGE_WIDTH, 3), dtype=np.uint8)
+        self._encode_buffer = io.BytesIO()
 
         flipped = config.attributes.fields["flipped"].bool_value
         if flipped:
             self._flipped = True
 
+        # zlib level for PNG output, 0 (stored, fastest) through 9
+        compress_level = int(config.attributes.fields["png_compress_level"].number_value)
+        self._png_compress_level = min(max(compress_level, 0), 9)
+        self._cached_image = None
+
     @classmethod
     def validate_config(cls, config: ComponentConfig) -> Sequence[str]:
         """Validate the MLX90641 IR Camera configuration."""
@@ -249,6 +467,13 @@ class MlxCamera(Camera, EasyResource):
                 )
         return [sensor_name]
 
+    def _frame_key_matches(self, key: Tuple[np.ndarray, int]) -> bool:
+        """Whether key names the frame the cached image was rendered from."""
+        cached = self._cached_frame_key
+        # Compare the rings by identity; holding the cached ring keeps its
+        # id from being reused by a newer one
+        return cached is not None and cached[0] is key[0] and cached[1] == key[1]
+
     async def get_image(
         self,
         mime_type: str = "",
@@ -257,28 +482,59 @@ class MlxCamera(Camera, EasyResource):
         timeout: Optional[float] = None,
         **kwargs
     ) -> ViamImage:
-        current_time = time.time()
+        # The render buffers are per camera, so render one image at a time;
+        # callers that queued behind a render usually find it cached
+        async with self._render_lock:
+            current_time = time.monotonic_ns()
+            # Looked up per call so a re-created sensor is picked up
+            local_sensor = MlxSensor.get_local(self._sensor_name)
+
+            # Return cached image if the sensor has no newer frame
+            if self._cached_image and self._cached_mime_type == mime_type:
+                if local_sensor is not None:
+                    fresh = self._frame_key_matches(local_sensor.frame_key)
+                else:
+                    fresh = (current_time - self._last_reading_time) < CACHE_DURATION_NS
+                if fresh:
+                    return self._cached_image
+
+            if local_sensor is not None:
+                # The heatmap normalization is unit-invariant, so skip the
+                # Fahrenheit conversion and only mirror when flipped
+                temperature = await local_sensor.get_frame(
+                    mirror=self._flipped, timeout=timeout)
+                self._cached_frame_key = local_sensor.frame_key
+            else:
+                # Only the flipped image needs the Fahrenheit fields
+                readings = await self.mlxsensor.get_readings(
+                    extra={"include_fahrenheit": self._flipped}, timeout=timeout)
+                if self._flipped:
+                    temperature = readings["all_temperatures_fahrenheit_mirrored"]
+                else:
+                    temperature = readings["all_temperatures_celsius"]
+
+            # The render kernel and Pillow's encoders release the GIL, so
+            # run them on the default executor to keep the event loop free
+            self._cached_image = await asyncio.get_running_loop().run_in_executor(
+                None,
+                partial(
+                    utils.create_thermal_image,
+                    temperature,
+                    self.heatmap_palette,
+                    self._resize_idx,
+                    width=IMAGE_WIDTH,
+                    height=IMAGE_HEIGHT,
+                    out=self._rgb_out,
+                    mime_type=mime_type,
+                    png_compress_level=self._png_compress_level,
+                    buffer=self._encode_buffer,
+                ),
+            )
+            self._cached_mime_type = mime_type
+            self._last_reading_time = current_time
 
-        # Return cached image if within cache duration
-        if self._cached_image and (current_time - self._last_reading_time) < CACHE_DURATION:
             return self._cached_image
 
-        readings = await self.mlxsensor.get_readings()
-        if self._flipped:
-            temperature = readings["all_temperatures_fahrenheit_mirrored"]
-        else:
-            temperature = readings["all_temperatures_celsius"]
-
-        self._cached_image = utils.create_thermal_image(
-            temperature,
-            self.heatmap_palette,
-            width=240,
-            height=320
-        )
-        self._last_reading_time = current_time
-
-        return self._cached_image
-
     async def get_images(
         self, *, timeout: Optional[float] = None, **kwargs
     ) -> Tuple[List[NamedImage], ResponseMetadata]:
@@ -292,7 +548,9 @@ class MlxCamera(Camera, EasyResource):
     async def get_properties(
     self, *, timeout: Optional[float] = None, **kwargs
     ) -> GetPropertiesResponse:
-        raise NotImplementedError()
+        # Advertise what get_image can serve so clients neither probe for
+        # point clouds nor negotiate an unsupported mime type
+        return self._properties
 
 if __name__ == "__main__":
     asyncio.run(Module.run_from_registry())
@@ -1,60 +1,210 @@
 """Thermal Image Processing Utilities for MLX90641 Camera Module"""
 import io
 import logging
-from typing import List
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
+import numpy as np
 from PIL import Image
 from viam.media.video import ViamImage
 
+import _fast
+
 logger = logging.getLogger(__name__)
 
-def create_heatmap_palette() -> List[int]:
-    """Pre-compute and cache the heatmap palette"""
-    palette: List[int] = []
-    for i in range(256):
-        if i < 85:  # Blue to Cyan
-            palette.extend([0, 0, int(i * 3)])
-        elif i < 170:  # Cyan to Yellow
-            palette.extend([0, 255, 255 - int((i - 85) * 3)])
-        else:  # Yellow to Red
-            palette.extend([255, 255 - int((i - 170) * 3), 0])
-    return palette
+# MLX90640 frame geometry
+FRAME_HEIGHT = 24
+FRAME_WIDTH = 32
+
+# Celsius to Fahrenheit affine coefficients, precomputed as float32 so the
+# conversion stays a single multiply-add over the frame without upcasting
+FAHRENHEIT_SCALE = np.float32(9 / 5)
+FAHRENHEIT_OFFSET = np.float32(32.0)
+
+# Pillow encoder and options for each supported MIME type. PNG is written
+# with stored (level 0) deflate blocks and BMP is uncompressed, so neither
+# pays for zlib on every frame.
+IMAGE_FORMATS: Dict[str, Tuple[str, Dict[str, Any]]] = {
+    "image/jpeg": ("JPEG", {"optimize": False}),
+    "image/png": ("PNG", {"compress_level": 0}),
+    "image/bmp": ("BMP", {}),
+}
+DEFAULT_MIME_TYPE = "image/jpeg"
+
+# Viam's raw RGBA format: a "RGBA" magic number and big-endian uint32 width
+# and height, followed by the pixels. Served without any encoder at all.
+RGBA_MIME_TYPE = "image/vnd.viam.rgba"
+RGBA_MAGIC_NUMBER = b"RGBA"
+
+
+@lru_cache(maxsize=1)
+def create_heatmap_lut() -> np.ndarray:
+    """
+    Heatmap palette as a contiguous (256, 3) uint8 RGB lookup table.
+    Built once per process and shared read-only by every camera.
+    """
+    i = np.arange(256, dtype=np.int16)
+    lut = np.zeros((256, 3), dtype=np.int16)
+    blue = i < 85  # Blue to Cyan
+    cyan = (i >= 85) & (i < 170)  # Cyan to Yellow
+    yellow = i >= 170  # Yellow to Red
+    lut[blue, 2] = i[blue] * 3
+    lut[cyan, 1] = 255
+    lut[cyan, 2] = 255 - (i[cyan] - 85) * 3
+    lut[yellow, 0] = 255
+    lut[yellow, 1] = 255 - (i[yellow] - 170) * 3
+    lut = lut.astype(np.uint8)
+    lut.setflags(write=False)
+    return lut
+
+
+def frame_range(frame: np.ndarray) -> Tuple[float, float]:
+    """Minimum and maximum of the finite pixels of a frame, (0, 0) if none are"""
+    if _fast.NUMBA_AVAILABLE:
+        lo, hi = _fast.minmax(np.ascontiguousarray(frame).ravel())
+        return float(lo), float(hi)
+    finite = np.isfinite(frame)
+    if finite.all():
+        return float(np.minimum.reduce(frame, axis=None)), float(np.maximum.reduce(frame, axis=None))
+    if not finite.any():
+        return 0.0, 0.0
+    values = frame[finite]
+    return float(values.min()), float(values.max())
+
+
+def derive_readings(
+        celsius: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float, float, float, float]:
+    """
+    Derive the Fahrenheit frame, its row-mirrored copy and the min/max in
+    both units from a Celsius frame, using the numba kernel when available.
+    """
+    if _fast.NUMBA_AVAILABLE:
+        return _fast.derive_readings(celsius)
+
+    fahrenheit = celsius * FAHRENHEIT_SCALE
+    fahrenheit += FAHRENHEIT_OFFSET
+
+    # Mirror each row of the 24x32 frame, then flatten
+    mirrored = np.ascontiguousarray(
+        fahrenheit.reshape(FRAME_HEIGHT, FRAME_WIDTH)[:, ::-1]).ravel()
+
+    # Fahrenheit is a monotonic affine map, so its extremes follow from the
+    # Celsius ones without scanning the Fahrenheit frame
+    min_c, max_c = frame_range(celsius)
+    return (
+        fahrenheit,
+        mirrored,
+        min_c,
+        max_c,
+        float(min_c * FAHRENHEIT_SCALE + FAHRENHEIT_OFFSET),
+        float(max_c * FAHRENHEIT_SCALE + FAHRENHEIT_OFFSET),
+    )
+
+
+def normalize_frame(frame: np.ndarray) -> np.ndarray:
+    """Scale a frame of temperatures to the 0-255 range as a uint8 array"""
+    if _fast.NUMBA_AVAILABLE:
+        normalized = np.empty(frame.size, dtype=np.uint8)
+        _fast.normalize_frame(np.ascontiguousarray(frame, dtype=np.float32).ravel(), normalized)
+        return normalized
+
+    min_temp, max_temp = frame_range(frame)
+    # Guard against a uniform frame without a per-pixel branch
+    temp_span = max(max_temp - min_temp, 1e-6)
+    # Scale in place so the only temporaries are the shifted frame and result
+    scaled = frame - min_temp
+    scaled *= np.float32(255.0 / temp_span)
+    return scaled.astype(np.uint8)
+
+
+def nearest_indices(src_size: int, dst_size: int) -> np.ndarray:
+    """Source index for each destination pixel of a nearest-neighbor resample"""
+    return (np.arange(dst_size) * src_size // dst_size).astype(np.intp)
+
+
+@lru_cache(maxsize=4)
+def create_resize_index(width: int, height: int) -> np.ndarray:
+    """
+    Flat source pixel index for every pixel of a width x height upscale.
+    Cached per output size and shared read-only between cameras.
+    """
+    rows = nearest_indices(FRAME_HEIGHT, height)
+    cols = nearest_indices(FRAME_WIDTH, width)
+    resize_idx = (rows[:, None] * FRAME_WIDTH + cols[None, :]).astype(np.int32).ravel()
+    resize_idx.setflags(write=False)
+    return resize_idx
+
+
+def encode_viam_rgba(rgb: np.ndarray) -> bytes:
+    """Pack a (height, width, 3) uint8 RGB array as opaque Viam raw RGBA"""
+    height, width, _ = rgb.shape
+    rgba = np.empty((height, width, 4), dtype=np.uint8)
+    rgba[..., :3] = rgb
+    rgba[..., 3] = 255
+    header = RGBA_MAGIC_NUMBER + width.to_bytes(4, "big") + height.to_bytes(4, "big")
+    return header + rgba.tobytes()
 
 
 def create_thermal_image(
-        frame: List[float],
-        heatmap_palette: List[int],
+        frame: np.ndarray,
+        heatmap_palette: np.ndarray,
+        resize_idx: np.ndarray,
         width: int,
-        height: int) -> ViamImage:
+        height: int,
+        out: Optional[np.ndarray] = None,
+        mime_type: str = DEFAULT_MIME_TYPE,
+        png_compress_level: Optional[int] = None,
+        buffer: Optional[io.BytesIO] = None) -> ViamImage:
     """
     Create a thermal image directly from sensor data.
     Combines normalization, heatmap application, and image creation into one flow.
+    When a preallocated (height, width, 3) uint8 out buffer is given the RGB
+    pixels are written into it, with all three steps run as a single fused
+    kernel when numba is available.
+    RGBA_MIME_TYPE skips encoding and returns the raw pixels. Other
+    unsupported mime types fall back to DEFAULT_MIME_TYPE, and
+    png_compress_level overrides the default zlib level for PNG output.
+    A caller-owned buffer is rewound and reused for the encoded bytes.
     """
     try:
-        # Normalize temperatures to 0-255 range directly to bytes
-        min_temp = min(frame)
-        max_temp = max(frame)
-        temp_range = max_temp - min_temp
-
-        # Create normalized bytes directly
-        normalized_data = bytes(
-            int(255 * (temp - min_temp) / temp_range) if temp_range != 0 else 0
-            for temp in frame
-        )
-
-        # Create image and apply transformations in one flow
-        img = Image.frombytes('L', (32, 24), normalized_data).resize((width, height))
-
-        # Apply heatmap palette
-        img.putpalette(heatmap_palette)
-        img = img.convert('RGB')
-
-        # Convert to PNG with minimal compression
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format='JPEG', optimize=False, compression_level=1)
-        img_bytes.seek(0)
-        return ViamImage(data=img_bytes.read(), mime_type='image/jpeg')
+        temps = np.asarray(frame, dtype=np.float32)
+        if _fast.NUMBA_AVAILABLE and out is not None:
+            _fast.render_thermal(temps, heatmap_palette, resize_idx, out)
+            rgb = out
+        else:
+            # Normalize temperatures to 0-255 range
+            normalized = normalize_frame(temps)
+
+            # Colorize the 768 source pixels through the (256, 3) LUT, then
+            # upscale with a single gather of whole RGB rows, written straight
+            # into out when the caller preallocated it
+            colors = heatmap_palette[normalized]
+            if out is not None:
+                np.take(colors, resize_idx, axis=0, out=out.reshape(-1, 3))
+                rgb = out
+            else:
+                rgb = colors.take(resize_idx, axis=0).reshape(height, width, 3)
+
+        if mime_type == RGBA_MIME_TYPE:
+            return ViamImage(data=encode_viam_rgba(rgb), mime_type=mime_type)
+
+        img = Image.fromarray(rgb)
+
+        if mime_type not in IMAGE_FORMATS:
+            mime_type = DEFAULT_MIME_TYPE
+        image_format, save_options = IMAGE_FORMATS[mime_type]
+        if png_compress_level is not None and image_format == "PNG":
+            save_options = {**save_options, "compress_level": png_compress_level}
+
+        if buffer is None:
+            img_bytes = io.BytesIO()
+        else:
+            img_bytes = buffer
+            img_bytes.seek(0)
+            img_bytes.truncate()
+        img.save(img_bytes, format=image_format, **save_options)
+        return ViamImage(data=img_bytes.getvalue(), mime_type=mime_type)
 
     except Exception as e:
-        logger.error("Failed to create thermal image %d:", e)
+        logger.error("Failed to create thermal image: %s", e)
         raise
@@ -0,0 +1,63 @@
+"""Test setup: import the module sources without Raspberry Pi hardware."""
+import os
+import sys
+import time
+import types
+
+import pytest
+from google.protobuf.struct_pb2 import Struct
+from viam.proto.app.robot import ComponentConfig
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# board and busio come from Blinka, which probes for a supported board at
+# import time; the tests never touch a real bus, so give them empty modules
+for _name in ("board", "busio"):
+    if _name not in sys.modules:
+        _module = types.ModuleType(_name)
+        sys.modules[_name] = _module
+sys.modules["board"].SCL = sys.modules["board"].SDA = None
+sys.modules["busio"].I2C = type("I2C", (), {})
+
+import _mlx_native  # noqa: E402
+import main  # noqa: E402
+
+
+class FakeI2C:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def deinit(self):
+        pass
+
+
+class FakeMLX:
+    """Stands in for FastMLX90640, producing a constant frame."""
+    subpage_ready_ns = 0
+    refresh_rate = 0
+
+    def __init__(self, i2c_bus, value: float = 20.0):
+        self.value = value
+
+    def getFrame(self, framebuf):
+        time.sleep(0.005)
+        self.subpage_ready_ns = time.monotonic_ns()
+        framebuf[:] = self.value
+
+
+def sensor_config(**attributes) -> ComponentConfig:
+    fields = Struct()
+    fields.update({"refresh_rate_hz": 64, **attributes})
+    return ComponentConfig(name="sensor", attributes=fields)
+
+
+@pytest.fixture
+def fake_hardware(monkeypatch, tmp_path):
+    device = tmp_path / "i2c-1"
+    device.touch()
+    monkeypatch.setattr(main, "I2C_DEVICES", (str(device),))
+    monkeypatch.setattr(_mlx_native, "NATIVE_AVAILABLE", False)
+    monkeypatch.setattr(main.busio, "I2C", FakeI2C, raising=False)
+    monkeypatch.setattr(main.time, "sleep", lambda _: None)
+    monkeypatch.setattr(main._fast_mlx, "FastMLX90640", FakeMLX)
+    return monkeypatch
@@ -0,0 +1,55 @@
+"""MlxCamera image cache tests against a fake sensor driver."""
+import asyncio
+
+from google.protobuf.struct_pb2 import Struct
+from viam.components.sensor import Sensor
+from viam.proto.app.robot import ComponentConfig
+
+import main
+from conftest import sensor_config
+
+
+class OneFrameMLX:
+    """Produces a single frame, then fails every read so frame_seq stays at 1."""
+    subpage_ready_ns = 0
+    refresh_rate = 0
+
+    def __init__(self, i2c_bus):
+        self.read = False
+
+    def getFrame(self, framebuf):
+        if self.read:
+            raise OSError("no new frame")
+        self.read = True
+        framebuf[:] = range(768)
+
+
+def camera_config() -> ComponentConfig:
+    fields = Struct()
+    fields.update({"sensor": "sensor"})
+    return ComponentConfig(name="camera", attributes=fields)
+
+
+def test_image_is_rendered_again_after_sensor_reconfigure(fake_hardware):
+    fake_hardware.setattr(main._fast_mlx, "FastMLX90640", OneFrameMLX)
+
+    async def wait_for_seq(sensor, seq):
+        while sensor.frame_seq != seq:
+            await asyncio.sleep(0.001)
+
+    async def scenario():
+        sensor = main.MlxSensor.new(sensor_config(), {})
+        try:
+            camera = main.MlxCamera.new(
+                camera_config(), {Sensor.get_resource_name("sensor"): sensor})
+            first = await camera.get_image()
+            assert await camera.get_image() is first
+
+            # The new reader restarts frame_seq at 1, matching the cached seq
+            sensor.reconfigure(sensor_config(), {})
+            await asyncio.wait_for(wait_for_seq(sensor, 1), 1)
+            assert await camera.get_image() is not first
+        finally:
+            await sensor.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,93 @@
+"""MlxSensor lifecycle and command tests against a fake driver."""
+import asyncio
+import base64
+
+import numpy as np
+import pytest
+
+import main
+from conftest import sensor_config
+
+
+class BrokenMLX:
+    def __init__(self, i2c_bus):
+        raise OSError("no MLX90640 on the bus")
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_get_raw_returns_packed_frame(fake_hardware):
+    async def scenario():
+        sensor = main.MlxSensor.new(sensor_config(), {})
+        try:
+            result = await sensor.do_command({"get_raw": True})
+        finally:
+            await sensor.close()
+        return result
+
+    result = run(scenario())
+    frame = np.frombuffer(base64.b64decode(result["frame_f32_le"]), "<f4")
+    assert frame.shape == (768,)
+    assert np.all(frame == 20.0)
+    assert (result["height"], result["width"]) == (24, 32)
+
+
+def test_get_raw_false_is_not_served(fake_hardware):
+    async def scenario():
+        sensor = main.MlxSensor.new(sensor_config(), {})
+        try:
+            with pytest.raises(ValueError):
+                await sensor.do_command({"get_raw": False})
+        finally:
+            await sensor.close()
+
+    run(scenario())
+
+
+def test_unknown_command_raises_value_error(fake_hardware):
+    async def scenario():
+        sensor = main.MlxSensor.new(sensor_config(), {})
+        try:
+            with pytest.raises(ValueError, match="Unknown command"):
+                await sensor.do_command({"calibrate": True})
+        finally:
+            await sensor.close()
+
+    run(scenario())
+
+def test_failed_reconfigure_does_not_serve_stale_frames(fake_hardware):
+    async def scenario():
+        sensor = main.MlxSensor.new(sensor_config(), {})
+        try:
+            readings = await sensor.get_readings()
+            assert readings["max_temp_celsius"] == 20.0
+
+            fake_hardware.setattr(main._fast_mlx, "FastMLX90640", BrokenMLX)
+            with pytest.raises(OSError):
+                sensor.reconfigure(sensor_config(), {})
+
+            assert sensor.frame_seq == 0
+            with pytest.raises(TimeoutError):
+                await sensor.get_readings(timeout=0.05)
+        finally:
+            await sensor.close()
+
+    run(scenario())
+
+
+def test_closing_one_sensor_keeps_the_other_reading(fake_hardware):
+    async def scenario():
+        first = main.MlxSensor.new(sensor_config(), {})
+        second = main.MlxSensor.new(sensor_config(), {})
+        try:
+            await second.get_readings()
+            await first.close()
+            seq = second.frame_seq
+            await asyncio.sleep(0.1)
+            assert second.frame_seq > seq
+        finally:
+            await second.close()
+
+    run(scenario())